@@ -1,10 +1,12 @@
 import sys
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple, Union
 
-from Disc import Point
+from Disc import Point, COLOR
 from Board import Board
+from Position import Position
+from EvalCache import EvalCache, CacheStats
 
 
 INT_MAX = sys.maxsize
@@ -31,9 +33,16 @@ class AI:
         pass
 
 
+@dataclass
 class AlphaBetaAI(AI):
     """
     Alpha-Beta法を実装したAIクラス．
+
+    Attributes:
+        copy_make (bool): Trueなら探索中にBoardのmove/undoを使わず，Positionをコピーして進める．
+        eval_cache_size (int): 評価値キャッシュの項目数の上限．0ならキャッシュしない．
+        mobility_weight (int): 評価関数における着手可能数の差の重み．
+        frontier_weight (int): 評価関数における開放された石の数の差の重み．
     """
 
     @dataclass(frozen=True)
@@ -48,6 +57,26 @@ class AlphaBetaAI(AI):
         """
         evaluated: int = 0
 
+    copy_make: bool = False
+    eval_cache_size: int = 1 << 16
+    mobility_weight: int = 1
+    frontier_weight: int = 1
+
+    def __post_init__(self):
+        self.__eval_cache: Optional[EvalCache] = EvalCache(self.eval_cache_size) if self.eval_cache_size > 0 else None
+
+    def get_stats(self) -> Dict[str, CacheStats]:
+        """
+        評価値キャッシュの統計を返す．キャッシュが無効なら空の辞書を返す．
+
+        Return:
+            (Dict[str, CacheStats]) キャッシュ名と統計の辞書．
+        """
+        stats: Dict[str, CacheStats] = {}
+        if self.__eval_cache is not None:
+            stats["eval_cache"] = self.__eval_cache.stats()
+        return stats
+
     def move(self, board: Board):
         """
         Alpha-Beta法を用いて，Boardを一手動かす．
@@ -67,17 +96,53 @@ class AlphaBetaAI(AI):
             board.move(movables[0])
             return
 
-        limit: int = INT_MAX if (Board.INFO.MAX_TURNS - board.get_turns) <= self.wld_depth else self.normal_depth
+        q: AlphaBetaAI.Move = self.search(board)
+        board.move(Point(q.x, q.y))
+
+    def search(self, board: Board) -> "AlphaBetaAI.Move":
+        """
+        Alpha-Beta法を用いて最善手を探索する．打てる箇所が一箇所だけでも評価値を求めるために探索する．
+        Boardは探索前の状態に戻される．
+
+        Args:
+            board (Board): 対戦板
+
+        Return:
+            (AlphaBetaAI.Move) 最善手とその評価値．打てる箇所がなければパスした後を探索し，
+                座標が(0, 0)のMoveを返す．終局していればNone．
+        """
+        movables: List[Point] = board.get_mvoable_pos()
+
+        if not movables:
+            if board.is_game_over():
+                return None
+            # パスした後の相手の最善手の評価値を反転する
+            board.pass_turn()
+            q: AlphaBetaAI.Move = self.search(board)
+            board.undo()
+            return AlphaBetaAI.Move(0, 0, -q.evaluated)
+
+        limit: int = INT_MAX if (Board.INFO.MAX_TURNS - board.get_turns()) <= self.wld_depth else self.normal_depth
         eval_max: int = -INT_MAX
         q: Point = None
+
+        if self.copy_make:
+            position: Position = board.to_position()
+            for p in movables:
+                _eval: int = -self.__alphabeta_position(position.play(p), limit-1, -INT_MAX, INT_MAX)
+                if _eval > eval_max:
+                    eval_max = _eval
+                    q = p
+            return AlphaBetaAI.Move(q.x, q.y, eval_max)
+
         for p in movables:
             board.move(p)
-            _eval: int = self.__alphabeta(board, limit-1, -INT_MAX, INT_MAX)
+            _eval: int = -self.__alphabeta(board, limit-1, -INT_MAX, INT_MAX)
             board.undo()
             if _eval > eval_max:
                 eval_max = _eval
                 q = p  # イミュータブルなオブジェクトだからコピーは大丈夫なはず
-        board.move(q)
+        return AlphaBetaAI.Move(q.x, q.y, eval_max)
 
     def __alphabeta(self, board: Board, limit: int, alpha: int, beta: int) -> int:
         """
@@ -92,7 +157,11 @@ class AlphaBetaAI(AI):
         Return:
             (int) 評価値．
         """
-        if board.is_game_over() or limit == 0:
+        if board.is_game_over():
+            # 終局なら石数の差を返す．
+            return self.__final_score(board)
+
+        if limit == 0:
             # 深さの上限に達したら評価値を返す．
             return self.__evaluate(board)
 
@@ -117,8 +186,105 @@ class AlphaBetaAI(AI):
                 return alpha
         return alpha
 
-    def __evaluate(self, board: Board) -> int:
-        return 0
+    def __alphabeta_position(self, position: Position, limit: int, alpha: int, beta: int) -> int:
+        """
+        Positionをコピーしながら進めるAlpha-Beta法．
+
+        Args:
+            position (Position): 局面．
+            limit (int): 上限値．
+            alpha (int): alpha．
+            beta (int): beta．
+
+        Return:
+            (int) 評価値．
+        """
+        # 着手可能位置は一度だけ求め，相手側はパスの時だけ調べる
+        moves: int = position.movables()
+
+        if not moves and not position.pass_turn().movables():
+            # 終局なら石数の差を返す．
+            return self.__final_score(position)
+
+        if limit == 0:
+            # 深さの上限に達したら評価値を返す．
+            return self.__evaluate(position)
+
+        if not moves:
+            # パスの時
+            return -self.__alphabeta_position(position.pass_turn(), limit, -beta, -alpha)
+
+        for p in Position.points(moves):
+            _eval: int = -self.__alphabeta_position(position.play(p), limit-1, -beta, -alpha)
+
+            alpha = alpha if alpha >= _eval else _eval
+
+            if alpha >= beta:
+                # ベータ刈り
+                return alpha
+        return alpha
+
+    @staticmethod
+    def __final_score(board: Union[Board, Position]) -> int:
+        """
+        終局した局面の，手番側から見た石数の差を返す．
+
+        Args:
+            board (Union[Board, Position]): 対戦板または局面．
+
+        Return:
+            (int) 手番側の石数から相手側の石数を引いた値．
+        """
+        color: int = board.color if isinstance(board, Position) else board.get_current_color()
+        return board.count_disc(color) - board.count_disc(-color)
+
+    def __evaluate(self, board: Union[Board, Position]) -> int:
+        """
+        手番側から見た評価値を返す．評価値キャッシュが有効なら局面をキーにしてキャッシュする．
+
+        Args:
+            board (Union[Board, Position]): 対戦板または局面．
+
+        Return:
+            (int) 評価値．
+        """
+        position: Position = board if isinstance(board, Position) else board.to_position()
+        if self.__eval_cache is None:
+            return self.__compute_evaluation(position)
+        return self.__eval_cache.get(position, lambda: self.__compute_evaluation(position))
+
+    def __compute_evaluation(self, position: Position) -> int:
+        """
+        着手可能数と開放された石の数の差から評価値を計算する．
+
+        Args:
+            position (Position): 局面．
+
+        Return:
+            (int) 手番側から見た評価値．
+        """
+        mobility_black, mobility_white, frontier_black, frontier_white = self.__features(position)
+        _eval: int = self.mobility_weight * (mobility_black - mobility_white) \
+            - self.frontier_weight * (frontier_black - frontier_white)
+        return _eval if position.color == COLOR.BLACK else -_eval
+
+    @staticmethod
+    def __features(position: Position) -> Tuple[int, int, int, int]:
+        """
+        評価に用いる特徴量を計算する．
+
+        Args:
+            position (Position): 局面．
+
+        Return:
+            (Tuple[int, int, int, int]) 黒と白の着手可能数，黒と白の開放された石の数．
+        """
+        black = Position(position.black, position.white, COLOR.BLACK)
+        frontier: int = position.frontier()
+        return (bin(black.movables()).count("1"),
+                bin(black.pass_turn().movables()).count("1"),
+                bin(frontier & position.black).count("1"),
+                bin(frontier & position.white).count("1"))
 
     def __sort(self, board: Board, movables: List[Point], limit: int) -> List[Point]:
         """
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from typing import List
 
 from Disc import Point, Disc, COLOR
+from Position import Position
 
 
 _BoardInfo = namedtuple("_BoardInfo", "BOARD_SIZE MAX_TURNS")
@@ -12,7 +13,7 @@ _DirBitmask = namedtuple("_DirBitmask", "NONE UPPER UPPER_LEFT LEFT LOWER_LEFT L
 @dataclass
 class ColorStorage:
     """
-    石数を保存するクラス．
+    石数やビットボードなど，色ごとの値を保存するクラス．
     """
     __data: List[int] = field(default_factory=lambda: [0]*3, init=False)
 
@@ -32,6 +33,7 @@ class ColorStorage:
 class Board:
     INFO = _BoardInfo(8, 60)
     DIRECTION = _DirBitmask(0, 1, 2, 4, 8, 16, 32, 64, 128)
+    SYMBOL = {COLOR.BLACK: "X", COLOR.WHITE: "O", COLOR.EMPTY: "-"}
 
     def __init__(self):
         # self.__raw_board: List[List[int]] = None
@@ -39,11 +41,12 @@ class Board:
 
         self.__current_color: int = 0
         # self.__update_log: List[List[Disc]] = []
-        self.__movable_pos: List[List[Point]] = [[] for _ in range(Board.INFO.BOARD_SIZE+1)]
+        self.__movable_pos: List[List[Point]] = [[] for _ in range(Board.INFO.MAX_TURNS+1)]
         self.__movable_dir: List[List[List[int]]] = [
             [[0]*(Board.INFO.BOARD_SIZE+2) for _ in range(Board.INFO.BOARD_SIZE+2)]
             for _ in range(Board.INFO.MAX_TURNS+1)]
         self.__discs: ColorStorage = ColorStorage()
+        self.__bitboards: ColorStorage = ColorStorage()
 
         self.init_game()
 
@@ -57,9 +60,9 @@ class Board:
         Return:
             (bool) 処理が成功したかどうか．
         """
-        if point.x < 0 or Board.INFO.BOARD_SIZE <= point.x:
+        if point.x < 1 or Board.INFO.BOARD_SIZE < point.x:
             return False
-        if point.y < 0 or Board.INFO.BOARD_SIZE <= point.y:
+        if point.y < 1 or Board.INFO.BOARD_SIZE < point.y:
             return False
         if self.__movable_dir[self.__turns][point.x][point.y] == Board.DIRECTION.NONE:
             return False
@@ -96,9 +99,9 @@ class Board:
     def undo(self):
         """
         直前の一手を元に戻す．成功するとTrueが返る．もとに戻せない場合，すなわち
-        まだ一手も打っていない場合はFalseが返る．
+        まだ一手も打っていない場合（文字列から読み込んだ局面を含む）はFalseが返る．
         """
-        if self.__turns == 0:
+        if self.__turns == 0 or not self.__update_log:
             return False
 
         self.__current_color = -self.__current_color
@@ -108,11 +111,10 @@ class Board:
         # 前回がパスかどうかで場合分け
         if not update:
             # 前回はパス
-            # MovablePosとMovableDirを再構築
+            # MovablePosとMovableDirを再構築（パスした局面には打てる手がないので空にするだけ）
             self.__movable_pos[self.__turns].clear()
-            for x in range(1, Board.INFO.MAX_TURNS):
-                for y in range(1, Board.INFO.MAX_TURNS):
-                    self.__movable_dir[self.__turns][x][y] = Board.DIRECTION.NONE
+            self.__movable_dir[self.__turns] = [
+                [Board.DIRECTION.NONE]*(Board.INFO.BOARD_SIZE+2) for _ in range(Board.INFO.BOARD_SIZE+2)]
         else:
             # 前回はパスではない
             self.__turns -= 1
@@ -130,6 +132,12 @@ class Board:
             self.__discs[-self.__current_color] += disc_diff - 1
             self.__discs[COLOR.EMPTY] += 1
 
+            # ビットボードの更新
+            placed = Position.bit(update[0])
+            mask = Position.bits(update)
+            self.__bitboards[self.__current_color] &= ~mask
+            self.__bitboards[-self.__current_color] |= mask & ~placed
+
         return True
 
     def is_game_over(self) -> bool:
@@ -147,8 +155,8 @@ class Board:
             return False
 
         # 現在の手番と逆の色が打てるかどうかを調べる
-        for x in range(1, Board.INFO.MAX_TURNS+1):
-            for y in range(1, Board.INFO.MAX_TURNS+1):
+        for x in range(1, Board.INFO.BOARD_SIZE+1):
+            for y in range(1, Board.INFO.BOARD_SIZE+1):
                 disc = Disc(x, y, -self.__current_color)
                 if self.__check_mobility(disc) != Board.DIRECTION.NONE:
                     return False
@@ -176,6 +184,10 @@ class Board:
         self.__discs[COLOR.WHITE] = 2
         self.__discs[COLOR.EMPTY] = Board.INFO.BOARD_SIZE * Board.INFO.BOARD_SIZE - 4
 
+        # ビットボードの初期設定
+        self.__bitboards[COLOR.BLACK] = Position.bits([Point(4, 5), Point(5, 4)])
+        self.__bitboards[COLOR.WHITE] = Position.bits([Point(4, 4), Point(5, 5)])
+
         self.__turns = 0
         self.__current_color = COLOR.BLACK
 
@@ -248,6 +260,103 @@ class Board:
         """
         return self.__turns
 
+    def to_string(self) -> str:
+        """
+        局面を文字列に変換する．a1, b1, ..., h1, a2, ..., h8の順に64マスを
+        X（黒），O（白），-（空き）で並べ，空白の後に手番の色を付け加えたもの．
+
+        Return:
+            (str) 局面を表す文字列．
+        """
+        cells = "".join(
+            Board.SYMBOL[self.__raw_board[x][y]]
+            for y in range(1, Board.INFO.BOARD_SIZE+1)
+            for x in range(1, Board.INFO.BOARD_SIZE+1))
+        return cells + " " + Board.SYMBOL[self.__current_color]
+
+    @classmethod
+    def from_string(cls, text: str) -> "Board":
+        """
+        to_stringの形式の文字列から局面を読み込んだBoardを生成する．
+        手数は石の数から求め，打った手の履歴は持たないのでundoは出来ない．
+
+        Args:
+            text (str): 局面を表す文字列．
+
+        Return:
+            (Board) 読み込んだ局面のBoard．
+        """
+        colors = {v: k for k, v in Board.SYMBOL.items()}
+        fields = text.split()
+        if len(fields) != 2 or len(fields[0]) != Board.INFO.BOARD_SIZE ** 2 or fields[1] not in ("X", "O"):
+            raise ValueError(text)
+        if any(c not in colors for c in fields[0]):
+            raise ValueError(text)
+
+        board = cls()
+        board.__load([colors[c] for c in fields[0]], colors[fields[1]])
+        return board
+
+    def to_position(self) -> Position:
+        """
+        現在の局面をPositionに変換する．ビットボードは着手・undoのたびに更新しているので，盤面の走査は行わない．
+
+        Return:
+            (Position) 現在の局面．
+        """
+        return Position(self.__bitboards[COLOR.BLACK], self.__bitboards[COLOR.WHITE], self.__current_color)
+
+    @classmethod
+    def from_position(cls, position: Position) -> "Board":
+        """
+        Positionの局面を読み込んだBoardを生成する．from_stringと同じく，undoは出来ない．
+
+        Args:
+            position (Position): 局面．
+
+        Return:
+            (Board) 読み込んだ局面のBoard．
+        """
+        if position.black & position.white or position.color not in (COLOR.BLACK, COLOR.WHITE):
+            raise ValueError(position)
+
+        board = cls()
+        board.__load([
+            position.get_color(Point(x, y))
+            for y in range(1, Board.INFO.BOARD_SIZE+1)
+            for x in range(1, Board.INFO.BOARD_SIZE+1)], position.color)
+        return board
+
+    def __load(self, cells: List[int], color: int):
+        """
+        cellsで指定された配置とcolorの手番で局面を設定し直す．
+
+        Args:
+            cells (List[int]): a1からh8の順に並んだ各マスの色．
+            color (int): 手番の色．
+        """
+        empty = cells.count(COLOR.EMPTY)
+        if empty > Board.INFO.MAX_TURNS:
+            raise ValueError(empty)
+
+        self.__bitboards[COLOR.BLACK] = 0
+        self.__bitboards[COLOR.WHITE] = 0
+        for i, c in enumerate(cells):
+            y, x = divmod(i, Board.INFO.BOARD_SIZE)
+            self.__raw_board[x+1][y+1] = c
+            if c != COLOR.EMPTY:
+                self.__bitboards[c] |= Position.bit(Point(x+1, y+1))
+
+        self.__discs[COLOR.BLACK] = cells.count(COLOR.BLACK)
+        self.__discs[COLOR.WHITE] = cells.count(COLOR.WHITE)
+        self.__discs[COLOR.EMPTY] = empty
+
+        self.__turns = Board.INFO.MAX_TURNS - empty
+        self.__current_color = color
+        self.__update_log = []
+
+        self.__init_movable()
+
     def __init_movable(self):
         """
         MovablePos[Turns]とMovableDir[Turns]を再計算．
@@ -431,6 +540,10 @@ class Board:
         self.__discs[-self.__current_color] -= disc_diff - 1
         self.__discs[COLOR.EMPTY] -= 1
 
+        mask = Position.bits(update)
+        self.__bitboards[self.__current_color] |= mask
+        self.__bitboards[-self.__current_color] &= ~mask
+
         self.__update_log.append(update)
 
 
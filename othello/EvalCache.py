@@ -0,0 +1,77 @@
+import time
+from collections import namedtuple, OrderedDict
+from typing import Any, Callable, Hashable
+
+
+CacheStats = namedtuple("CacheStats", "hits misses hit_rate time_saved")
+
+
+class EvalCache:
+    """
+    局面の評価値を保存する，大きさに上限のあるLRUキャッシュ．
+    上限を超えると最も長く参照されていない項目を捨てる．
+
+    Attributes:
+        size (int): 保存する項目数の上限．
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError(size)
+        self.size: int = size
+        self.__data: OrderedDict = OrderedDict()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__compute_time: float = 0.0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        keyに対応する値を返す．保存されていなければcomputeで計算して保存する．
+
+        Args:
+            key (Hashable): 局面などのキー．
+            compute (Callable[[], Any]): 値を計算する関数．
+
+        Return:
+            (Any) keyに対応する値．
+        """
+        data = self.__data
+        if key in data:
+            self.__hits += 1
+            data.move_to_end(key)
+            return data[key]
+
+        self.__misses += 1
+        start = time.perf_counter()
+        value = compute()
+        self.__compute_time += time.perf_counter() - start
+
+        data[key] = value
+        if len(data) > self.size:
+            data.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        保存した項目と統計をすべて削除する．
+        """
+        self.__data.clear()
+        self.__hits = 0
+        self.__misses = 0
+        self.__compute_time = 0.0
+
+    def stats(self) -> CacheStats:
+        """
+        ヒット数，ミス数，ヒット率と，ヒットによって省けた推定時間（秒）を返す．
+        推定時間は，ミスした時の平均計算時間にヒット数を掛けたもの．キーの作成と参照の時間は差し引いていない．
+
+        Return:
+            (CacheStats) キャッシュの統計．
+        """
+        total = self.__hits + self.__misses
+        hit_rate = self.__hits / total if total else 0.0
+        time_saved = self.__compute_time / self.__misses * self.__hits if self.__misses else 0.0
+        return CacheStats(self.__hits, self.__misses, hit_rate, time_saved)
+
+    def __len__(self) -> int:
+        return len(self.__data)
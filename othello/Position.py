@@ -0,0 +1,234 @@
+from collections import namedtuple
+from typing import List
+
+from Disc import Point, COLOR
+
+
+_FULL = (1 << 64) - 1
+_NOT_A = 0xfefefefefefefefe  # a列を除くマスク
+_NOT_H = 0x7f7f7f7f7f7f7f7f  # h列を除くマスク
+
+# (シフト量, シフト後のマスク)．正なら左シフト，負なら右シフト．
+_DIRECTIONS = (
+    (-8, _FULL),    # 上
+    (8, _FULL),     # 下
+    (-1, _NOT_H),   # 左
+    (1, _NOT_A),    # 右
+    (-7, _NOT_A),   # 右上
+    (-9, _NOT_H),   # 左上
+    (7, _NOT_H),    # 左下
+    (9, _NOT_A),    # 右下
+)
+
+
+def _shift(bits: int, d: int, mask: int) -> int:
+    if d > 0:
+        return (bits << d) & mask & _FULL
+    return (bits >> -d) & mask
+
+
+class Position(namedtuple("_Position", "black white color")):
+    """
+    局面を表すイミュータブルなクラス．ハッシュ可能で，pickleしても数十バイトに収まる．
+    playは新しいPositionを返すので，探索ではmove/undoの代わりにコピーして使える（copy-make）．
+
+    Attributes:
+        black (int): 黒石の位置を表すビットボード．
+        white (int): 白石の位置を表すビットボード．
+        color (int): 手番の色．
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def bit(point: Point) -> int:
+        """
+        pointで指定された位置のビットを返す．a1が最下位ビット，h8が最上位ビット．
+
+        Args:
+            point (Point): 指定位置．
+
+        Return:
+            (int) 対応するビット．
+        """
+        return 1 << ((point.y - 1) * 8 + (point.x - 1))
+
+    @staticmethod
+    def bits(points: List[Point]) -> int:
+        """
+        pointsのすべての位置にビットが立ったビットボードを返す．
+
+        Args:
+            points (List[Point]): 位置のlist．
+
+        Return:
+            (int) ビットボード．
+        """
+        bits = 0
+        for p in points:
+            bits |= Position.bit(p)
+        return bits
+
+    @staticmethod
+    def points(bits: int) -> List[Point]:
+        """
+        bitsで立っているビットの位置を，a1からh8の順に並べたlistを返す．
+
+        Args:
+            bits (int): ビットボード．
+
+        Return:
+            (List[Point]) 位置のlist．
+        """
+        pos = []
+        while bits:
+            i = (bits & -bits).bit_length() - 1
+            pos.append(Point(i % 8 + 1, i // 8 + 1))
+            bits &= bits - 1
+        return pos
+
+    @property
+    def player(self) -> int:
+        """
+        (int) 手番側の石のビットボード．
+        """
+        return self.black if self.color == COLOR.BLACK else self.white
+
+    @property
+    def opponent(self) -> int:
+        """
+        (int) 相手側の石のビットボード．
+        """
+        return self.white if self.color == COLOR.BLACK else self.black
+
+    @property
+    def turns(self) -> int:
+        """
+        (int) 石の数から求めた手数．
+        """
+        return bin(self.black | self.white).count("1") - 4
+
+    def movables(self) -> int:
+        """
+        手番側が石を打てる位置にビットが立った整数値を返す．
+
+        Return:
+            (int) 石を打てる位置のビットボード．
+        """
+        p, o = self.player, self.opponent
+        empty = ~(p | o) & _FULL
+        moves = 0
+        for d, mask in _DIRECTIONS:
+            t = _shift(p, d, mask) & o
+            for _ in range(5):
+                t |= _shift(t, d, mask) & o
+            moves |= _shift(t, d, mask) & empty
+        return moves
+
+    def frontier(self) -> int:
+        """
+        空きマスに隣接している石（開放された石）の位置にビットが立った整数値を返す．
+
+        Return:
+            (int) 空きマスに隣接している石のビットボード．
+        """
+        empty = ~(self.black | self.white) & _FULL
+        adjacent = 0
+        for d, mask in _DIRECTIONS:
+            adjacent |= _shift(empty, d, mask)
+        return adjacent & ~empty & _FULL
+
+    def get_movable_pos(self) -> List[Point]:
+        """
+        石を打てる座標が並んだlistを返す．並び順はBoard.get_mvoable_posと同じ．
+
+        Return:
+            (List[Point]) 石を打てる座標が並んだlist．
+        """
+        return Position.points(self.movables())
+
+    def play(self, point: Point) -> "Position":
+        """
+        pointで指定された位置に石を打った後の局面を返す．
+
+        Args:
+            point (Point): 指定位置．
+
+        Return:
+            (Position) 石を打った後の局面．
+        """
+        if not (1 <= point.x <= 8 and 1 <= point.y <= 8):
+            raise ValueError(point)
+        m = Position.bit(point)
+        p, o = self.player, self.opponent
+        if (p | o) & m:
+            raise ValueError(point)
+
+        flipped = 0
+        for d, mask in _DIRECTIONS:
+            f, t = 0, _shift(m, d, mask)
+            while t & o:
+                f |= t
+                t = _shift(t, d, mask)
+            if t & p:
+                flipped |= f
+        if not flipped:
+            raise ValueError(point)
+
+        p |= m | flipped
+        o &= ~flipped
+        if self.color == COLOR.BLACK:
+            return Position(p, o, COLOR.WHITE)
+        return Position(o, p, COLOR.BLACK)
+
+    def pass_turn(self) -> "Position":
+        """
+        手番を相手に渡した局面を返す．
+
+        Return:
+            (Position) パスした後の局面．
+        """
+        return Position(self.black, self.white, -self.color)
+
+    def is_game_over(self) -> bool:
+        """
+        両者とも打てる手がなければTrueを返す．
+
+        Return:
+            (bool) ゲームが終了しているか．
+        """
+        return not self.movables() and not self.pass_turn().movables()
+
+    def count_disc(self, color: int) -> int:
+        """
+        colorで指定された色の石の数を数える．色にはBLACK，WHITE，EMPTYを指定可能．
+
+        Args:
+            color (int): 指定する石の色．
+
+        Return:
+            (int) 指定された色の石の数
+        """
+        if color == COLOR.BLACK:
+            return bin(self.black).count("1")
+        if color == COLOR.WHITE:
+            return bin(self.white).count("1")
+        if color == COLOR.EMPTY:
+            return 64 - bin(self.black | self.white).count("1")
+        raise ValueError(color)
+
+    def get_color(self, point: Point) -> int:
+        """
+        pointで指定された位置の色を返す．
+
+        Args:
+            point (Point): 指定する位置．
+
+        Return:
+            (int) その位置の色．
+        """
+        m = Position.bit(point)
+        if self.black & m:
+            return COLOR.BLACK
+        if self.white & m:
+            return COLOR.WHITE
+        return COLOR.EMPTY
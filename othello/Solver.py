@@ -0,0 +1,184 @@
+import argparse
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterator
+
+from Disc import Point
+from Board import Board
+from AI import AlphaBetaAI
+
+
+OFFSET_ASCII_A = ord("a")
+SEPARATOR = ";"
+
+_ai: AlphaBetaAI = None
+
+
+def format_point(point: Point) -> str:
+    """
+    pointをリバーシ形式の文字列（a1〜h8）に変換する．
+
+    Args:
+        point (Point): 指定位置．
+
+    Return:
+        (str) リバーシ形式の文字列．
+    """
+    return chr(point.x - 1 + OFFSET_ASCII_A) + str(point.y)
+
+
+def read_positions(path: str, skip: int = 0) -> Iterator[str]:
+    """
+    局面ファイルを一行ずつ読み込み，局面の文字列を返すイテレータ．
+    空行と#で始まる行は読み飛ばす．
+
+    Args:
+        path (str): 局面ファイルのパス．
+        skip (int): 先頭から読み飛ばす局面の数．
+
+    Return:
+        (Iterator[str]) 局面の文字列．
+    """
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if skip > 0:
+                skip -= 1
+                continue
+            yield line
+
+
+def solve(text: str, ai: AlphaBetaAI) -> str:
+    """
+    文字列で与えられた局面をaiで探索し，結果を一行の文字列にして返す．
+    結果は「局面;最善手;評価値」の形式で，評価値は手番側から見たもの．打てる箇所がなければ最善手はpassに，
+    終局していれば最善手はendになり，評価値は石数の差になる．
+    局面が不正ならValueErrorが送出される．
+
+    Args:
+        text (str): Board.to_stringの形式の局面．
+        ai (AlphaBetaAI): 探索に用いるAI．
+
+    Return:
+        (str) 探索結果．
+    """
+    board = Board.from_string(text)
+    q: AlphaBetaAI.Move = ai.search(board)
+    if q is None:
+        color = board.get_current_color()
+        score = board.count_disc(color) - board.count_disc(-color)
+        return SEPARATOR.join((board.to_string(), "end", str(score)))
+    if q.x == 0:
+        return SEPARATOR.join((board.to_string(), "pass", str(q.evaluated)))
+    return SEPARATOR.join((board.to_string(), format_point(q), str(q.evaluated)))
+
+
+def _init_worker(ai: AlphaBetaAI):
+    global _ai
+    _ai = ai
+
+
+def _solve_worker(text: str) -> str:
+    # 不正な局面が一つあっても全体が止まらないよう，その行にはエラーを書き込む
+    try:
+        return solve(text, _ai)
+    except Exception as e:
+        return SEPARATOR.join((text, "error", " ".join(repr(e).split())))
+
+
+def _count_solved(path: str) -> int:
+    """
+    出力ファイルに書き込み済みの結果の数を数える．中断によって途中まで書かれた
+    最後の行は切り捨てる．
+
+    Args:
+        path (str): 出力ファイルのパス．
+
+    Return:
+        (int) 書き込み済みの結果の数．
+    """
+    if not os.path.exists(path):
+        return 0
+
+    count, end = 0, 0
+    with open(path, "rb+") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            count += 1
+            end += len(line)
+        f.truncate(end)
+    return count
+
+
+def solve_file(src: str, dst: str, ai: AlphaBetaAI = None, workers: int = None, window: int = None) -> int:
+    """
+    srcの局面ファイルを読みながらプロセスプールで並列に探索し，結果を入力順にdstへ書き込む．
+    同時に処理中の局面はwindow個までに抑えるので，ファイルの大きさによらずメモリ使用量は一定になる．
+    dstに結果が既にあれば，その続きから再開する．解けなかった局面は「局面;error;理由」の行になる．
+
+    Args:
+        src (str): 局面ファイルのパス．
+        dst (str): 結果を書き込むファイルのパス．
+        ai (AlphaBetaAI): 探索に用いるAI．Noneならデフォルト設定のAlphaBetaAI．
+        workers (int): プロセス数．Noneならos.cpu_count()．
+        window (int): 同時に処理中にする局面の上限．Noneならプロセス数の4倍．
+
+    Return:
+        (int) 今回新たに解いた局面の数．
+    """
+    ai = AlphaBetaAI() if ai is None else ai
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    window = workers * 4 if window is None else window
+    if workers < 1:
+        raise ValueError(workers)
+    if window < 1:
+        raise ValueError(window)
+
+    positions = read_positions(src, _count_solved(dst))
+    pending: Deque[Future] = deque()
+    solved = 0
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(ai,)) as executor, \
+            open(dst, "a") as out:
+        for text in positions:
+            if len(pending) >= window:
+                out.write(pending.popleft().result() + "\n")
+                out.flush()
+                solved += 1
+            pending.append(executor.submit(_solve_worker, text))
+
+        while pending:
+            out.write(pending.popleft().result() + "\n")
+            out.flush()
+            solved += 1
+
+    return solved
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("1以上の整数を指定してください: " + text)
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="局面ファイルを一括で探索する．")
+    parser.add_argument("src", help="一行に一局面を書いた局面ファイル")
+    parser.add_argument("dst", help="結果を書き込むファイル（既にあれば続きから再開する）")
+    parser.add_argument("-j", "--workers", type=_positive_int, default=None, help="プロセス数")
+    parser.add_argument("-w", "--window", type=_positive_int, default=None, help="同時に処理中にする局面の上限")
+    parser.add_argument("--copy-make", action="store_true", help="Positionをコピーしながら探索する")
+    args = parser.parse_args()
+
+    ai = AlphaBetaAI(copy_make=args.copy_make)
+    solved = solve_file(args.src, args.dst, ai=ai, workers=args.workers, window=args.window)
+    print(solved, "局面を解きました．")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import os
+import random
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pytest
+
+from Board import Board
+
+
+def _random_board(seed: int, moves: int) -> Board:
+    """
+    seedで決まる乱数で最大moves手進めたBoardを返す．打てる手がなければパスする．
+    """
+    rng = random.Random(seed)
+    board = Board()
+    for _ in range(moves):
+        if board.is_game_over():
+            break
+        movables = board.get_mvoable_pos()
+        if not movables:
+            board.pass_turn()
+            continue
+        board.move(rng.choice(movables))
+    return board
+
+
+@pytest.fixture
+def random_board():
+    return _random_board
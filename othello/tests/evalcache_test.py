@@ -0,0 +1,93 @@
+import pytest
+
+from AI import AlphaBetaAI
+from Disc import Point, COLOR
+from EvalCache import EvalCache, CacheStats
+from Position import Position
+
+
+class Counter:
+    """
+    計算された回数を数える関数オブジェクト．
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        def compute():
+            self.calls += 1
+            return value
+        return compute
+
+
+def test_evicts_least_recently_used():
+    cache = EvalCache(2)
+    compute = Counter()
+
+    assert cache.get("a", compute(1)) == 1
+    assert cache.get("b", compute(2)) == 2
+    # aを参照し直すと，最も長く参照されていないのはbになる
+    assert cache.get("a", compute(-1)) == 1
+    assert cache.get("c", compute(3)) == 3
+    assert len(cache) == 2
+    assert compute.calls == 3
+
+    assert cache.get("a", compute(-1)) == 1
+    assert compute.calls == 3
+    assert cache.get("b", compute(4)) == 4
+    assert compute.calls == 4
+
+
+def test_stats():
+    cache = EvalCache(4)
+    assert cache.stats() == CacheStats(0, 0, 0.0, 0.0)
+
+    cache.get("a", lambda: 1)
+    cache.get("a", lambda: 1)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 2)
+    assert stats.hit_rate == 0.5
+    assert stats.time_saved >= 0.0
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats() == CacheStats(0, 0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_rejects_non_positive_size(size):
+    with pytest.raises(ValueError):
+        EvalCache(size)
+
+
+def test_disabled_cache_has_no_stats():
+    assert AlphaBetaAI(eval_cache_size=0).get_stats() == {}
+
+
+@pytest.mark.parametrize("seed, moves", [(0, 10), (3, 24)])
+@pytest.mark.parametrize("copy_make", [False, True])
+def test_search_with_cache_matches_without(seed, moves, copy_make, random_board):
+    board = random_board(seed, moves)
+    uncached = AlphaBetaAI(normal_depth=3, eval_cache_size=0, copy_make=copy_make)
+    cached = AlphaBetaAI(normal_depth=3, copy_make=copy_make)
+
+    assert cached.search(board) == uncached.search(board)
+    stats = cached.get_stats()["eval_cache"]
+    assert stats.hits + stats.misses > 0
+
+
+def test_frontier():
+    # a1, b1, a2, b2を黒が埋めた局面では，空きマスに接していないのはa1だけ
+    corner = Position.bits([Point(1, 1), Point(2, 1), Point(1, 2), Point(2, 2)])
+    position = Position(corner, 0, COLOR.BLACK)
+    assert position.frontier() == Position.bits([Point(2, 1), Point(1, 2), Point(2, 2)])
+
+    # 白石も含めて数える
+    position = Position(corner, Position.bit(Point(8, 8)), COLOR.BLACK)
+    assert position.frontier() == Position.bits([Point(2, 1), Point(1, 2), Point(2, 2), Point(8, 8)])
+
+    # 盤面が埋まっていれば開放された石はない
+    assert Position((1 << 64) - 1, 0, COLOR.WHITE).frontier() == 0
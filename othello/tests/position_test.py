@@ -0,0 +1,79 @@
+import pickle
+import random
+
+import pytest
+
+from AI import AlphaBetaAI
+from Board import Board
+from Disc import Point
+from Position import Position
+
+
+def play_random_game(seed: int):
+    """
+    ランダムに一局打ち，各手番でBoardとPositionを比較する．パスも含む．
+    """
+    rng = random.Random(seed)
+    board = Board()
+    position = board.to_position()
+    passes = 0
+
+    while not board.is_game_over():
+        assert position == board.to_position()
+        assert position.turns == board.get_turns()
+        assert not position.is_game_over()
+        assert position.get_movable_pos() == [Point(p.x, p.y) for p in board.get_mvoable_pos()]
+
+        movables = board.get_mvoable_pos()
+        if not movables:
+            assert board.pass_turn()
+            position = position.pass_turn()
+            passes += 1
+            continue
+
+        p = rng.choice(movables)
+        assert board.move(p)
+        position = position.play(p)
+
+    assert position == board.to_position()
+    assert position.is_game_over()
+    return passes
+
+
+def test_play_matches_board_move():
+    passes = sum(play_random_game(seed) for seed in range(40))
+    # パスの局面も比較されていること
+    assert passes > 0
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_position_round_trip(seed, random_board):
+    board = random_board(seed, seed * 6)
+
+    position = board.to_position()
+    loaded = Board.from_position(position)
+    assert loaded.to_position() == position
+    assert loaded.to_string() == board.to_string()
+    assert pickle.loads(pickle.dumps(position)) == position
+    assert hash(Position(*position)) == hash(position)
+
+
+def test_play_rejects_illegal_move():
+    position = Board().to_position()
+    with pytest.raises(ValueError):
+        position.play(Point(1, 1))  # 裏返せる石がない
+    with pytest.raises(ValueError):
+        position.play(Point(4, 4))  # 既に石がある
+    with pytest.raises(ValueError):
+        position.play(Point(0, 4))  # 盤外
+
+
+@pytest.mark.parametrize("seed, moves", [(0, 10), (1, 20), (2, 54)])
+def test_copy_make_search_matches_make_unmake(seed, moves, random_board):
+    board = random_board(seed, moves)
+    text = board.to_string()
+
+    make_unmake = AlphaBetaAI(normal_depth=3, wld_depth=12).search(board)
+    assert board.to_string() == text
+    copy_make = AlphaBetaAI(normal_depth=3, wld_depth=12, copy_make=True).search(board)
+    assert copy_make == make_unmake
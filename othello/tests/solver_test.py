@@ -0,0 +1,81 @@
+import pytest
+
+from AI import AlphaBetaAI
+from Board import Board
+import Solver
+
+
+def test_initial_board_string():
+    text = Board().to_string()
+    assert text == "-" * 27 + "OX" + "-" * 6 + "XO" + "-" * 27 + " X"
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_string_round_trip(seed, random_board):
+    board = random_board(seed, seed * 6)
+    loaded = Board.from_string(board.to_string())
+
+    assert loaded.to_string() == board.to_string()
+    assert loaded.get_turns() == board.get_turns()
+    assert loaded.get_current_color() == board.get_current_color()
+    assert loaded.get_mvoable_pos() == board.get_mvoable_pos()
+    assert not loaded.undo()
+
+
+@pytest.mark.parametrize("text", [
+    "garbage",
+    "-" * 64 + " X",
+    "-" * 27 + "OX" + "-" * 6 + "XO" + "-" * 27 + " XO",
+    "-" * 27 + "OX" + "-" * 6 + "XO" + "-" * 26 + "? X",
+    "-" * 27 + "OX" + "-" * 6 + "XO" + "-" * 27,
+])
+def test_from_string_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        Board.from_string(text)
+
+
+def test_count_solved_truncates_partial_line(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_bytes(b"a;c4;1\nb;d3;2\nc;e6")
+
+    assert Solver._count_solved(str(path)) == 2
+    assert path.read_bytes() == b"a;c4;1\nb;d3;2\n"
+
+
+def test_count_solved_missing_file(tmp_path):
+    assert Solver._count_solved(str(tmp_path / "out.txt")) == 0
+
+
+def test_solve_file_records_errors_and_resumes(tmp_path, random_board):
+    src, dst = tmp_path / "pos.txt", tmp_path / "out.txt"
+    positions = [random_board(seed, 20).to_string() for seed in range(3)]
+    src.write_text("# comment\n" + positions[0] + "\ngarbage\n\n" + "\n".join(positions[1:]) + "\n")
+    ai = AlphaBetaAI(normal_depth=1, wld_depth=0)
+
+    assert Solver.solve_file(str(src), str(dst), ai=ai, workers=1, window=2) == 4
+    lines = dst.read_text().splitlines()
+    assert [line.split(";")[0] for line in lines] == positions[:1] + ["garbage"] + positions[1:]
+    assert lines[1].split(";")[1] == "error"
+
+    # 途中で中断された出力から再開する
+    dst.write_text("\n".join(lines[:2]) + "\n" + lines[2][:10])
+    assert Solver.solve_file(str(src), str(dst), ai=ai, workers=1) == 2
+    assert dst.read_text().splitlines() == lines
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"window": 0}])
+def test_solve_file_rejects_non_positive(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        Solver.solve_file(str(tmp_path / "pos.txt"), str(tmp_path / "out.txt"), **kwargs)
+
+
+def test_solve_records_final_score_of_finished_game():
+    ai = AlphaBetaAI(normal_depth=1, wld_depth=0)
+    assert Solver.solve("X" * 64 + " O", ai) == "X" * 64 + " O;end;-64"
+
+
+def test_solve_searches_after_pass():
+    # 黒は打てないが白には打てる手が残っている局面．完全読みの結果は黒から見て-12
+    text = "--XXXXOXXXXXXOOXXOXOOOOXXOXOOOOXXOOOXOOXXOXOOXOXXOOOOOXXXOOXXXXX X"
+    ai = AlphaBetaAI(normal_depth=1, wld_depth=6)
+    assert Solver.solve(text, ai) == text + ";pass;-12"